@@ -1,4 +1,7 @@
 # requires you to set the OPENAI_API_KEY environment variable
+import hashlib
+import sys
+
 AGENT_MODEL = 'openai:gpt-4o'
 
 RECOMMENDED_PROMPT_PREFIX = "# System context\nYou are part of a multi-agent system called the Pydantic AI Framework, designed to make agent coordination and execution easy. Agents uses two primary abstraction: **Agents** and **Tools**. An agent encompasses instructions and tools that can either provide additional functionality or hand off a conversation to another agent when appropriate. Transfers between agents are handled seamlessly in the background; do not mention or draw attention to these transfers in your conversation with the user.\n"
@@ -372,3 +375,20 @@ SUPERVISOR_INSTRUCTIONS = f""""
     User: "Hello"
     → Use `respond_to_user("Hello! I'm here to help with your beneficiaries and investments. What is your client_id?")`
     """
+
+# The instruction strings above are assembled from f-strings; intern them once
+# so every consumer shares a single stable object, and precompute a digest per
+# agent so response caches can key on the exact prompt content.
+BENE_INSTRUCTIONS = sys.intern(BENE_INSTRUCTIONS)
+INVEST_INSTRUCTIONS = sys.intern(INVEST_INSTRUCTIONS)
+SUPERVISOR_INSTRUCTIONS = sys.intern(SUPERVISOR_INSTRUCTIONS)
+
+def _prompt_sha(instructions: str) -> str:
+    return hashlib.blake2b(instructions.encode(), digest_size=16).hexdigest()
+
+# System-prompt digest per agent name, for cache key construction
+AGENT_PROMPT_SHAS = {
+    BENE_AGENT_NAME: _prompt_sha(BENE_INSTRUCTIONS),
+    INVEST_AGENT_NAME: _prompt_sha(INVEST_INSTRUCTIONS),
+    SUPERVISOR_AGENT_NAME: _prompt_sha(SUPERVISOR_INSTRUCTIONS),
+}
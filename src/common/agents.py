@@ -1,8 +1,17 @@
+import asyncio
+import functools
 import logging
+import re
+import sys
+import time
 from typing import Optional
 from dataclasses import dataclass
 
+import httpx
+
 from pydantic_ai import Agent, RunContext, ModelRetry
+from pydantic_ai.models.openai import OpenAIModel, OpenAIModelSettings
+from pydantic_ai.providers.openai import OpenAIProvider
 
 from common.agent_constants import (
     SUPERVISOR_AGENT_NAME, SUPERVISOR_INSTRUCTIONS,
@@ -11,6 +20,7 @@ from common.agent_constants import (
 )
 from common.beneficiaries_manager import BeneficiariesManager
 from common.investment_manager import InvestmentManager, InvestmentAccount
+from common.response_cache import shared_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +32,41 @@ def debug_print(message: str):
     if DEBUG_MODE:
         print(message)
 
+### Handoff Trigger Messages
+# Module-level constants so the synthesized handoff turn is byte-identical
+# every time - a shifting token prefix defeats provider-side prompt caching.
+# Interned: handoffs (and workflow replays, which re-execute this path)
+# assign a pointer instead of rebuilding the string.
+BENE_HANDOFF_TRIGGER = sys.intern("Process the user's beneficiary request from the conversation history.")
+INVEST_HANDOFF_TRIGGER = sys.intern("Process the user's investment request from the conversation history.")
+SUPERVISOR_HANDOFF_TRIGGER = sys.intern("The user has a new request. Route it to the appropriate agent.")
+
+### Response Validation Patterns
+# Precompiled once at import - a single C-level regex scan per response
+# instead of a Python loop of substring checks over a lowered copy.
+_NUMBERED_LINE_RE = re.compile(r"^\s*[1-4]\.", re.MULTILINE)
+_BENE_FORBIDDEN_RE = re.compile(
+    r"update|edit|modify|change|manage|further|let me know|if you need",
+    re.IGNORECASE)
+_INVEST_FORBIDDEN_RE = re.compile(
+    r"update|edit|modify|change|manage|details|make changes|further|let me know|if you need|wish to",
+    re.IGNORECASE)
+
+### Confirmation Keywords
+# Hoisted so the per-message scans reuse one tuple instead of rebuilding a
+# list literal on every call.
+_CONFIRMATION_KEYWORDS = ('yes', 'confirm', 'sure', 'ok', 'proceed', 'go ahead', 'correct', 'affirmative')
+_CONFIRM_WORDS = ('yes', 'confirm', 'sure', 'ok', 'proceed')
+
 ### Dependencies
-@dataclass
+@dataclass(slots=True)
 class AgentDependencies:
     client_id: Optional[str] = None
     next_agent: Optional[str] = None  # Signals routing to another agent
     trigger_message: Optional[str] = None  # Message for next agent
     current_agent_name: str = SUPERVISOR_AGENT_NAME  # For debugging/logging
     message_history: list = None  # Message history for confirmation checking
+    mutated: bool = False  # Set by mutating tools; mutating runs must not be response-cached
 
     def __post_init__(self):
         if self.message_history is None:
@@ -37,6 +74,27 @@ class AgentDependencies:
 
 ### Output Functions
 
+def _require_client_id(client_id: str, purpose: str):
+    """Shared guard used by every routing output function."""
+    if not client_id or client_id.strip() == "":
+        raise ValueError(f"client_id is required for {purpose}")
+
+async def _route_to_supervisor(ctx: RunContext[AgentDependencies], client_id: str) -> str:
+    """Shared body for both specialists' route-back-to-supervisor functions."""
+    try:
+        _require_client_id(client_id, "routing")
+
+        debug_print(f"[{ctx.deps.current_agent_name}] Routing back to {SUPERVISOR_AGENT_NAME}")
+
+        ctx.deps.client_id = client_id
+        ctx.deps.next_agent = SUPERVISOR_AGENT_NAME
+        ctx.deps.trigger_message = SUPERVISOR_HANDOFF_TRIGGER
+
+        return ""  # Empty response - routing happens in main loop
+    except Exception as e:
+        logger.error(f"Error routing back to supervisor: {e}")
+        return f"I encountered a problem with the system. Please try again. (Debug: {str(e)})"
+
 # Supervisor Agent Output Functions
 async def respond_to_user(ctx: RunContext[AgentDependencies], response: str) -> str:
     """
@@ -58,14 +116,13 @@ async def route_to_beneficiary_agent(ctx: RunContext[AgentDependencies], client_
         client_id: The client's ID (must be provided)
     """
     try:
-        if not client_id or client_id.strip() == "":
-            raise ValueError("client_id is required for routing to beneficiary agent")
+        _require_client_id(client_id, "routing to beneficiary agent")
 
         debug_print(f"[{ctx.deps.current_agent_name}] Routing to {BENE_AGENT_NAME}")
 
         ctx.deps.client_id = client_id
         ctx.deps.next_agent = BENE_AGENT_NAME
-        ctx.deps.trigger_message = "Process the user's beneficiary request from the conversation history."
+        ctx.deps.trigger_message = BENE_HANDOFF_TRIGGER
 
         return ""  # Empty response - routing happens in main loop
     except Exception as e:
@@ -81,14 +138,13 @@ async def route_to_investment_agent(ctx: RunContext[AgentDependencies], client_i
         client_id: The client's ID (must be provided)
     """
     try:
-        if not client_id or client_id.strip() == "":
-            raise ValueError("client_id is required for routing to investment agent")
+        _require_client_id(client_id, "routing to investment agent")
 
         debug_print(f"[{ctx.deps.current_agent_name}] Routing to {INVEST_AGENT_NAME}")
 
         ctx.deps.client_id = client_id
         ctx.deps.next_agent = INVEST_AGENT_NAME
-        ctx.deps.trigger_message = "Process the user's investment request from the conversation history."
+        ctx.deps.trigger_message = INVEST_HANDOFF_TRIGGER
 
         return ""  # Empty response - routing happens in main loop
     except Exception as e:
@@ -108,23 +164,26 @@ async def respond_about_beneficiaries(ctx: RunContext[AgentDependencies], respon
     try:
         debug_print(f"[{ctx.deps.current_agent_name}] Responding about beneficiaries")
 
+        # Lower once; the checks below were each allocating their own copy
+        response_lower = response.lower()
+
         # Check if this is a confirmation request (should not validate format)
         is_confirmation_request = (
-            'are you sure' in response.lower() and
-            'confirm' in response.lower()
+            'are you sure' in response_lower and
+            'confirm' in response_lower
         )
 
         # Check if this looks like a beneficiary list response
         # (contains "beneficiar" and mentions names/relationships)
         is_list_response = (
-            'beneficiar' in response.lower() and
+            'beneficiar' in response_lower and
             ('(' in response and ')' in response) and  # Has relationship in parentheses
             not is_confirmation_request  # Don't validate confirmation requests
         )
 
         if is_list_response:
             # Validate format - MUST use numbered list
-            if not any(line.strip().startswith(('1.', '2.', '3.', '4.')) for line in response.split('\n')):
+            if not _NUMBERED_LINE_RE.search(response):
                 raise ModelRetry(
                     "CRITICAL FORMAT ERROR: You are listing beneficiaries but NOT using numbered format. "
                     "You MUST use this EXACT format:\n\n"
@@ -136,16 +195,13 @@ async def respond_about_beneficiaries(ctx: RunContext[AgentDependencies], respon
                 )
 
             # Check for forbidden words
-            forbidden_words = ['update', 'edit', 'modify', 'change', 'manage', 'further', 'let me know', 'if you need']
-            response_lower = response.lower()
-
-            for word in forbidden_words:
-                if word in response_lower:
-                    raise ModelRetry(
-                        f"Response contains forbidden word '{word}'. You MUST use EXACTLY this ending: "
-                        "'Would you like to add, remove or list your beneficiaries?' "
-                        "Do NOT use: update, edit, modify, change, manage, or phrases like 'let me know'."
-                    )
+            forbidden = _BENE_FORBIDDEN_RE.search(response)
+            if forbidden:
+                raise ModelRetry(
+                    f"Response contains forbidden word '{forbidden.group(0).lower()}'. You MUST use EXACTLY this ending: "
+                    "'Would you like to add, remove or list your beneficiaries?' "
+                    "Do NOT use: update, edit, modify, change, manage, or phrases like 'let me know'."
+                )
 
             # Check for required exact question
             if "Would you like to add, remove or list your beneficiaries?" not in response:
@@ -169,20 +225,7 @@ async def route_from_beneficiary_to_supervisor(ctx: RunContext[AgentDependencies
     Args:
         client_id: The client's ID
     """
-    try:
-        if not client_id or client_id.strip() == "":
-            raise ValueError("client_id is required for routing")
-
-        debug_print(f"[{ctx.deps.current_agent_name}] Routing back to {SUPERVISOR_AGENT_NAME}")
-
-        ctx.deps.client_id = client_id
-        ctx.deps.next_agent = SUPERVISOR_AGENT_NAME
-        ctx.deps.trigger_message = "The user has a new request. Route it to the appropriate agent."
-
-        return ""  # Empty response - routing happens in main loop
-    except Exception as e:
-        logger.error(f"Error in route_from_beneficiary_to_supervisor: {e}")
-        return f"I encountered a problem with the system. Please try again. (Debug: {str(e)})"
+    return await _route_to_supervisor(ctx, client_id)
 
 # Investment Agent Output Functions
 async def respond_about_investments(ctx: RunContext[AgentDependencies], response: str) -> str:
@@ -197,23 +240,26 @@ async def respond_about_investments(ctx: RunContext[AgentDependencies], response
     try:
         debug_print(f"[{ctx.deps.current_agent_name}] Responding about investments")
 
+        # Lower once; the checks below were each allocating their own copy
+        response_lower = response.lower()
+
         # Check if this is a confirmation request (should not validate format)
         is_confirmation_request = (
-            'are you sure' in response.lower() and
-            'confirm' in response.lower()
+            'are you sure' in response_lower and
+            'confirm' in response_lower
         )
 
         # Check if this looks like an investment list response
         # (contains "investment" or "account" and mentions money/balance)
         is_list_response = (
-            ('investment' in response.lower() or 'account' in response.lower()) and
-            ('$' in response or 'balance' in response.lower()) and
+            ('investment' in response_lower or 'account' in response_lower) and
+            ('$' in response or 'balance' in response_lower) and
             not is_confirmation_request  # Don't validate confirmation requests
         )
 
         if is_list_response:
             # Validate format - MUST use numbered list
-            if not any(line.strip().startswith(('1.', '2.', '3.', '4.')) for line in response.split('\n')):
+            if not _NUMBERED_LINE_RE.search(response):
                 raise ModelRetry(
                     "CRITICAL FORMAT ERROR: You are listing investments but NOT using numbered format. "
                     "You MUST use this EXACT format:\n\n"
@@ -225,16 +271,13 @@ async def respond_about_investments(ctx: RunContext[AgentDependencies], response
                 )
 
             # Check for forbidden words
-            forbidden_words = ['update', 'edit', 'modify', 'change', 'manage', 'details', 'make changes', 'further', 'let me know', 'if you need', 'wish to']
-            response_lower = response.lower()
-
-            for word in forbidden_words:
-                if word in response_lower:
-                    raise ModelRetry(
-                        f"Response contains forbidden word/phrase '{word}'. You MUST use EXACTLY this ending: "
-                        "'Would you like to open, close or list your investment accounts?' "
-                        "Do NOT use: update, edit, modify, change, manage, details, make changes, or phrases like 'let me know' or 'wish to'."
-                    )
+            forbidden = _INVEST_FORBIDDEN_RE.search(response)
+            if forbidden:
+                raise ModelRetry(
+                    f"Response contains forbidden word/phrase '{forbidden.group(0).lower()}'. You MUST use EXACTLY this ending: "
+                    "'Would you like to open, close or list your investment accounts?' "
+                    "Do NOT use: update, edit, modify, change, manage, details, make changes, or phrases like 'let me know' or 'wish to'."
+                )
 
             # Check for required exact question
             if "Would you like to open, close or list your investment accounts?" not in response:
@@ -258,20 +301,7 @@ async def route_from_investment_to_supervisor(ctx: RunContext[AgentDependencies]
     Args:
         client_id: The client's ID
     """
-    try:
-        if not client_id or client_id.strip() == "":
-            raise ValueError("client_id is required for routing")
-
-        debug_print(f"[{ctx.deps.current_agent_name}] Routing back to {SUPERVISOR_AGENT_NAME}")
-
-        ctx.deps.client_id = client_id
-        ctx.deps.next_agent = SUPERVISOR_AGENT_NAME
-        ctx.deps.trigger_message = "The user has a new request. Route it to the appropriate agent."
-
-        return ""  # Empty response - routing happens in main loop
-    except Exception as e:
-        logger.error(f"Error in route_from_investment_to_supervisor: {e}")
-        return f"I encountered a problem with the system. Please try again. (Debug: {str(e)})"
+    return await _route_to_supervisor(ctx, client_id)
 
 ### Confirmation Validation Helper
 
@@ -287,7 +317,6 @@ def check_for_confirmation_in_history(context: RunContext[AgentDependencies], ac
         True if confirmation found, False otherwise
     """
     # Look at the last few messages for confirmation keywords
-    confirmation_keywords = ['yes', 'confirm', 'sure', 'ok', 'proceed', 'go ahead', 'correct', 'affirmative']
 
     # Get message history from deps (works in both Temporal and non-Temporal contexts)
     message_history = context.deps.message_history
@@ -319,24 +348,105 @@ def check_for_confirmation_in_history(context: RunContext[AgentDependencies], ac
 
     # Check if any recent message contains confirmation
     for msg in recent_messages:
-        if any(keyword in msg for keyword in confirmation_keywords):
+        if any(keyword in msg for keyword in _CONFIRMATION_KEYWORDS):
             debug_print(f"Found confirmation keyword in message: '{msg}'")
             return True
 
     debug_print("No confirmation found in recent messages")
     return False
 
+### Tool Result Cache
+# Short-TTL cache for the idempotent list tools, keyed per client. A single
+# reasoning loop often reads the same list several times (list -> confirm ->
+# delete); within the TTL those repeats skip the disk entirely. Mutating
+# tools invalidate their client's entries.
+_TOOL_CACHE_TTL = 30.0
+_tool_cache: dict = {}
+
+def _tool_cache_get(kind: str, client_id: str):
+    entry = _tool_cache.get((kind, client_id))
+    if entry is not None and time.monotonic() - entry[0] < _TOOL_CACHE_TTL:
+        return entry[1]
+    return None
+
+def _tool_cache_set(kind: str, client_id: str, value):
+    _tool_cache[(kind, client_id)] = (time.monotonic(), value)
+
+def _tool_cache_invalidate(client_id: str):
+    for key in [k for k in _tool_cache if k[1] == client_id]:
+        del _tool_cache[key]
+
+async def _warm_client_caches_safe(client_id: str):
+    """Best-effort wrapper for fire-and-forget warms; never raises."""
+    try:
+        await warm_client_caches(client_id)
+    except Exception as e:
+        logger.warning(f"Client cache warm failed: {e}")
+
+async def warm_client_caches(client_id: str):
+    """
+    Read both stores concurrently and seed the tool cache, so the agent's
+    next list_beneficiaries/list_investments calls are served from memory.
+    Used by the chat loop to prefetch during user think time.
+    """
+    beneficiaries, investments = await asyncio.gather(
+        asyncio.to_thread(get_beneficiaries_mgr().list_beneficiaries, client_id),
+        asyncio.to_thread(get_investment_mgr().list_investment_accounts, client_id),
+    )
+    _tool_cache_set("beneficiaries", client_id, beneficiaries)
+    _tool_cache_set("investments", client_id, investments)
+
 ### Managers
+# Lazily constructed so importing this module doesn't load the JSON stores;
+# importers that never touch a tool (CLI --help, tests) skip the cost.
 
-beneficiaries_mgr = BeneficiariesManager()
-investment_mgr = InvestmentManager()
+@functools.cache
+def get_beneficiaries_mgr() -> BeneficiariesManager:
+    return BeneficiariesManager()
+
+@functools.cache
+def get_investment_mgr() -> InvestmentManager:
+    return InvestmentManager()
 
 ### Agents
 
-AGENT_MODEL = 'openai:gpt-4.1'
+AGENT_MODEL = 'gpt-4.1'
+# The supervisor is a three-way router (beneficiary / investment /
+# needs-client-id) - a small model handles that with lower cost and TTFT.
+# The specialists keep the larger model for tool-call fidelity.
+SUPERVISOR_MODEL = 'gpt-4o-mini'
+
+# One HTTP client shared by every agent: keep-alive skips the TLS handshake
+# on each turn, and HTTP/2 multiplexes concurrent requests (parallel tool
+# calls, speculative dispatch) over a single connection.
+_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+def _openai_model(model_name: str) -> OpenAIModel:
+    return OpenAIModel(model_name, provider=OpenAIProvider(http_client=_http_client))
+
+def _cache_settings(agent_name: str) -> OpenAIModelSettings:
+    """
+    Shared model settings for an agent.
+
+    OpenAI prefix caching is implicit, but a stable per-agent cache key
+    routes every request for the same agent to the same cache shard, so the
+    ~2 KB static system prompt (the literal first block, interned in
+    agent_constants) prefills at the cached rate instead of full price.
+
+    parallel_tool_calls lets the model emit independent tool calls in one
+    turn; pydantic-ai then executes them concurrently, so total tool latency
+    is the slowest call instead of the sum.
+    """
+    return OpenAIModelSettings(
+        openai_prompt_cache_key=f"wealth-management:{agent_name}",
+        parallel_tool_calls=True)
 
 supervisor_agent = Agent(
-    AGENT_MODEL,
+    _openai_model(SUPERVISOR_MODEL),
     name=SUPERVISOR_AGENT_NAME,
     deps_type=AgentDependencies,
     output_type=[
@@ -345,10 +455,11 @@ supervisor_agent = Agent(
         route_to_investment_agent
     ],
     system_prompt=SUPERVISOR_INSTRUCTIONS,
+    model_settings=_cache_settings(SUPERVISOR_AGENT_NAME),
 )
 
 beneficiary_agent = Agent(
-    AGENT_MODEL,
+    _openai_model(AGENT_MODEL),
     name=BENE_AGENT_NAME,
     deps_type=AgentDependencies,
     output_type=[
@@ -356,10 +467,11 @@ beneficiary_agent = Agent(
         route_from_beneficiary_to_supervisor
     ],
     system_prompt=BENE_INSTRUCTIONS,
+    model_settings=_cache_settings(BENE_AGENT_NAME),
 )
 
 investment_agent = Agent(
-    AGENT_MODEL,
+    _openai_model(AGENT_MODEL),
     name=INVEST_AGENT_NAME,
     deps_type=AgentDependencies,
     output_type=[
@@ -367,6 +479,7 @@ investment_agent = Agent(
         route_from_investment_to_supervisor
     ],
     system_prompt=INVEST_INSTRUCTIONS,
+    model_settings=_cache_settings(INVEST_AGENT_NAME),
 )
 
 ### Tools
@@ -400,6 +513,11 @@ async def set_client_id(context: RunContext[AgentDependencies], client_id: str)
 
     context.deps.client_id = client_id
 
+    # Fire-and-forget: the next turn almost always lists one of this
+    # client's stores, so warm both caches while the model is still
+    # composing its reply
+    asyncio.create_task(_warm_client_caches_safe(client_id))
+
     debug_print(f"****>>> Deps.client id is now set to {context.deps.client_id}")
     return f"Client ID set to: {client_id}"
 
@@ -409,7 +527,14 @@ async def add_beneficiaries(
         context: RunContext[AgentDependencies],
         first_name: str, last_name: str, relationship: str
 ) -> None:
-    beneficiaries_mgr.add_beneficiary(context.deps.client_id, first_name, last_name, relationship)
+    # The manager does synchronous file I/O - run it in a worker thread so
+    # the event loop keeps servicing other tasks
+    await asyncio.to_thread(
+        get_beneficiaries_mgr().add_beneficiary,
+        context.deps.client_id, first_name, last_name, relationship)
+    context.deps.mutated = True
+    _tool_cache_invalidate(context.deps.client_id)
+    shared_cache.invalidate(context.deps.client_id)
 
 @beneficiary_agent.tool
 async def list_beneficiaries(
@@ -419,7 +544,14 @@ async def list_beneficiaries(
     """
     List the beneficiaries for the given client id.
     """
-    return beneficiaries_mgr.list_beneficiaries(context.deps.client_id)
+    cached = _tool_cache_get("beneficiaries", context.deps.client_id)
+    if cached is not None:
+        return cached
+
+    beneficiaries = await asyncio.to_thread(
+        get_beneficiaries_mgr().list_beneficiaries, context.deps.client_id)
+    _tool_cache_set("beneficiaries", context.deps.client_id, beneficiaries)
+    return beneficiaries
 
 @beneficiary_agent.tool
 async def delete_beneficiaries(
@@ -469,7 +601,7 @@ async def delete_beneficiaries(
                                 last_user_msg = part.content.lower()
 
                                 # Check if this looks like a "remove X" command rather than a confirmation
-                                if 'remove' in last_user_msg and not any(kw in last_user_msg for kw in ['yes', 'confirm', 'sure', 'ok', 'proceed']):
+                                if 'remove' in last_user_msg and not any(kw in last_user_msg for kw in _CONFIRM_WORDS):
                                     raise ModelRetry(
                                         "CRITICAL ERROR: The user's last message was a remove REQUEST, not a confirmation. "
                                         f"Last message: '{part.content}'\n\n"
@@ -484,7 +616,8 @@ async def delete_beneficiaries(
                     break
 
         # Look up the beneficiary by name to get the ID
-        beneficiaries = beneficiaries_mgr.list_beneficiaries(context.deps.client_id)
+        beneficiaries = await asyncio.to_thread(
+            get_beneficiaries_mgr().list_beneficiaries, context.deps.client_id)
         full_name = f"{first_name} {last_name}".lower()
 
         matching_beneficiary = None
@@ -499,7 +632,11 @@ async def delete_beneficiaries(
 
         beneficiary_id = matching_beneficiary['beneficiary_id']
         debug_print(f"Tool: Deleting beneficiary {first_name} {last_name} (ID: {beneficiary_id}) from account {context.deps.client_id}")
-        beneficiaries_mgr.delete_beneficiary(context.deps.client_id, beneficiary_id)
+        await asyncio.to_thread(
+            get_beneficiaries_mgr().delete_beneficiary, context.deps.client_id, beneficiary_id)
+        context.deps.mutated = True
+        _tool_cache_invalidate(context.deps.client_id)
+        shared_cache.invalidate(context.deps.client_id)
         return f"Successfully deleted {first_name} {last_name}"
 
 
@@ -508,7 +645,14 @@ async def list_investments(context: RunContext[AgentDependencies]) -> list:
     """
     List the investments for a given client id.
     """
-    return investment_mgr.list_investment_accounts(context.deps.client_id)
+    cached = _tool_cache_get("investments", context.deps.client_id)
+    if cached is not None:
+        return cached
+
+    investments = await asyncio.to_thread(
+        get_investment_mgr().list_investment_accounts, context.deps.client_id)
+    _tool_cache_set("investments", context.deps.client_id, investments)
+    return investments
 
 
 @investment_agent.tool
@@ -522,7 +666,12 @@ async def open_investment(context: RunContext[AgentDependencies],
         name=name,
         balance=balance)
 
-    return investment_mgr.add_investment_account(investment_account)
+    new_account = await asyncio.to_thread(
+        get_investment_mgr().add_investment_account, investment_account)
+    context.deps.mutated = True
+    _tool_cache_invalidate(context.deps.client_id)
+    shared_cache.invalidate(context.deps.client_id)
+    return new_account
 
 @investment_agent.tool
 async def close_investment(context: RunContext[AgentDependencies],
@@ -569,7 +718,7 @@ async def close_investment(context: RunContext[AgentDependencies],
                             last_user_msg = part.content.lower()
 
                             # Check if this looks like a "close X" command rather than a confirmation
-                            if 'close' in last_user_msg and not any(kw in last_user_msg for kw in ['yes', 'confirm', 'sure', 'ok', 'proceed']):
+                            if 'close' in last_user_msg and not any(kw in last_user_msg for kw in _CONFIRM_WORDS):
                                 raise ModelRetry(
                                     "CRITICAL ERROR: The user's last message was a close REQUEST, not a confirmation. "
                                     f"Last message: '{part.content}'\n\n"
@@ -583,6 +732,11 @@ async def close_investment(context: RunContext[AgentDependencies],
                     break
                 break
 
-    return investment_mgr.delete_investment_account(
+    deleted = await asyncio.to_thread(
+        get_investment_mgr().delete_investment_account,
         client_id=context.deps.client_id,
         investment_id=investment_id)
+    context.deps.mutated = True
+    _tool_cache_invalidate(context.deps.client_id)
+    shared_cache.invalidate(context.deps.client_id)
+    return deleted
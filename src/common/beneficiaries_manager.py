@@ -1,7 +1,5 @@
 import json
 import os
-import argparse
-import uuid  # For generating unique beneficiary IDs
 import logging
 from typing import List, Dict, Any
 
@@ -54,8 +52,14 @@ class BeneficiariesManager:
             data (dict): The beneficiary data to save.
         """
         try:
-            with open(self.file_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            # Serialize once and write a single preformatted blob - json.dump
+            # with indent emits a stream of tiny writes otherwise. The tmp
+            # file + os.replace keeps the write atomic.
+            buf = json.dumps(data, indent=4).encode()
+            tmp = self.file_path + '.tmp'
+            with open(tmp, 'wb', buffering=1 << 20) as f:
+                f.write(buf)
+            os.replace(tmp, self.file_path)
         except Exception as e:
             logger.error(f"Error saving data to '{self.file_path}': {e}")
 
@@ -81,6 +85,8 @@ class BeneficiariesManager:
             last_name (str): Last name of the beneficiary.
             relationship (str): Relationship to the client.
         """
+        import uuid  # For generating unique beneficiary IDs; deferred so library imports skip it
+
         data = self._load_data()
 
         # Ensure the client ID exists in the data
@@ -137,6 +143,8 @@ class BeneficiariesManager:
 # --- Command Line Interface (CLI) Setup ---
 
 def main():
+    import argparse  # CLI-only; deferred so library imports skip it
+
     parser = argparse.ArgumentParser(
         description="Manage beneficiaries for different clients.",
         epilog="Example usage:\n"
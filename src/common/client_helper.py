@@ -1,13 +1,26 @@
+import functools
 import os
 
+from pathlib import Path
+
 from temporalio.service import TLSConfig
-from temporalio.envconfig import ClientConfig
 
-from common.util import str_to_bool
+@functools.lru_cache(maxsize=8)
+def _load_tls(cert_path: str, key_path: str) -> TLSConfig:
+    # Memoized per (cert, key) pair so multiple workers/clients in the same
+    # process read and parse the cert files exactly once.
+    return TLSConfig(
+        client_cert=Path(cert_path).read_bytes(),
+        client_private_key=Path(key_path).read_bytes(),
+    )
 
 class ClientHelper:
     def __init__(self):
-        # Reads from envirnoment variables. 
+        # Deferred import - temporalio.envconfig is only needed when a helper
+        # is actually constructed, not when this module is imported.
+        from temporalio.envconfig import ClientConfig
+
+        # Reads from envirnoment variables.
         self.client_config = ClientConfig.load_client_connect_config()
         # hack to stuff in a default value if it isn't set
         if self.client_config.get('target_host') is None:
@@ -16,3 +29,14 @@ class ClientHelper:
         self.address = self.client_config.get('target_host')
         self.namespace = self.client_config.get('namespace')
         self.taskQueue = os.getenv("TEMPORAL_TASK_QUEUE", "PY-AI-Supervisor")
+        self.tlsCertPath = os.getenv("TEMPORAL_TLS_CERT", "")
+        self.tlsKeyPath = os.getenv("TEMPORAL_TLS_KEY", "")
+
+        # Every caller connects via Client.connect(**client_config), so the
+        # mTLS config has to ride along in it to take effect
+        tls_config = self.get_tls_config()
+        if tls_config is not None:
+            self.client_config['tls'] = tls_config
+
+    def get_tls_config(self):
+        return _load_tls(self.tlsCertPath, self.tlsKeyPath) if (self.tlsCertPath and self.tlsKeyPath) else None
@@ -1,10 +1,10 @@
-import json
 import time
 import os
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Tuple, Union
 from enum import Enum
 from dataclasses import asdict
 
+import orjson
 import redis.asyncio as redis
 
 from .user_message import ChatInteraction
@@ -17,19 +17,29 @@ class EventType(str, Enum):
 
 class EventStreamManager:
     """
-    Manages a Redis list-based event stream for chat conversations.
-    
-    Uses LPUSH for O(1) appends and LRANGE for efficient range queries.
-    Each event has an implicit sequence number based on its position in the list.
+    Manages a Redis Streams-based event stream for chat conversations.
+
+    Uses XADD for O(1) appends and XRANGE/XREAD for range and tail queries.
+    Entries are appended with explicit sequential ids ("<n>-0" for the n-th
+    event), so an index maps directly to a stream id and index-based reads
+    fetch only the requested tail.
     """
     
     def __init__(self, redis_host: str = None, redis_port: int = None):
         self.redis_host = redis_host or os.getenv("REDIS_HOST", "localhost")
         self.redis_port = redis_port or int(os.getenv("REDIS_PORT", "6379"))
+        # A blocking pool: the worker runs up to 256 concurrent activities,
+        # and with a plain ConnectionPool anything past max_connections
+        # raises "Too many connections" instead of waiting - exactly the
+        # burst this pool exists to absorb. Blocking checkout lets excess
+        # appends queue briefly for a free connection.
         self.redis_client = redis.Redis(
-            host=self.redis_host, 
-            port=self.redis_port,
-            decode_responses=True
+            connection_pool=redis.BlockingConnectionPool(
+                host=self.redis_host,
+                port=self.redis_port,
+                decode_responses=True,
+                max_connections=64
+            )
         )
     
     def _get_stream_key(self, workflow_id: str) -> str:
@@ -56,6 +66,32 @@ class EventStreamManager:
             chat_interaction
         )
     
+    async def append_chat_interactions(
+        self,
+        workflow_id: str,
+        chat_interactions: List[ChatInteraction]
+    ) -> int:
+        """
+        Append a batch of chat interactions in one pipelined round trip.
+
+        Returns the new total length of the event stream.
+        """
+        stream_key = self._get_stream_key(workflow_id)
+
+        total = await self.redis_client.xlen(stream_key)
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for offset, chat_interaction in enumerate(chat_interactions, 1):
+            event = {
+                "type": EventType.CHAT_INTERACTION.value,
+                "content": asdict(chat_interaction)
+            }
+            pipe.xadd(stream_key, {"event": orjson.dumps(event)},
+                      id=f"{total + offset}-0")
+        await pipe.execute()
+
+        return total + len(chat_interactions)
+
     async def append_status_update(
         self, 
         workflow_id: str, 
@@ -94,13 +130,18 @@ class EventStreamManager:
             "content": content_dict
         }
         
-        event_json = json.dumps(event)
-        
-        # Use RPUSH to add to the end (chronological order)
-        # RPUSH returns the new length of the list after insertion
-        new_length = await self.redis_client.rpush(stream_key, event_json)
-        
-        return new_length
+        # orjson serializes straight to bytes, several times faster than the
+        # stdlib encoder on this per-turn path
+        event_json = orjson.dumps(event)
+
+        # XADD with an explicit sequential id; a concurrent append makes the
+        # stale id rejected and the caller (an activity with a retry policy)
+        # recompute it
+        total = await self.redis_client.xlen(stream_key)
+        await self.redis_client.xadd(stream_key, {"event": event_json},
+                                     id=f"{total + 1}-0")
+
+        return total + 1
     
     async def get_events_from_index(
         self, 
@@ -118,20 +159,12 @@ class EventStreamManager:
             List of events in chronological order
         """
         stream_key = self._get_stream_key(workflow_id)
-        
-        # Get all events from the specified index to the end
-        event_strings = await self.redis_client.lrange(stream_key, from_index, -1)
-        
-        # Parse events
-        events = []
-        for event_str in event_strings:
-            try:
-                event = json.loads(event_str)
-                events.append(event)
-            except json.JSONDecodeError:
-                continue  # Skip malformed events
-        
-        return events
+
+        # Entry ids embed the 1-based sequence number, so only the requested
+        # tail crosses the wire rather than the whole stream per poll
+        entries = await self.redis_client.xrange(stream_key, min=f"{from_index + 1}-0")
+
+        return self._parse_entries(entries)
     
     async def get_all_events(self, workflow_id: str) -> List[Dict[str, Any]]:
         """
@@ -140,24 +173,63 @@ class EventStreamManager:
         Returns events in chronological order.
         """
         stream_key = self._get_stream_key(workflow_id)
-        
-        # Get all events
-        event_strings = await self.redis_client.lrange(stream_key, 0, -1)
-        
-        # Parse events (already in chronological order due to RPUSH)
+
+        # Get all entries (already in chronological order due to XADD)
+        entries = await self.redis_client.xrange(stream_key)
+
+        return self._parse_entries(entries)
+
+    async def get_events_since_id(
+        self,
+        workflow_id: str,
+        last_id: str = "$",
+        block_ms: int = 5000
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Tail the stream, blocking server-side until new events arrive.
+
+        Unlike polling get_events_from_index in a loop, XREAD BLOCK parks on
+        the Redis server and wakes on the very next XADD - no client-side
+        sleeps or wasted round trips.
+
+        Args:
+            workflow_id: The workflow ID
+            last_id: Stream ID to read after ("$" means only new events)
+            block_ms: How long to block waiting for events, in milliseconds
+
+        Returns:
+            Tuple of (new_last_id, events); events is empty on timeout.
+        """
+        stream_key = self._get_stream_key(workflow_id)
+
+        result = await self.redis_client.xread(
+            {stream_key: last_id}, block=block_ms, count=100
+        )
+
+        if not result:
+            return last_id, []
+
+        # xread returns [(stream_key, [(entry_id, fields), ...])]
+        entries = result[0][1]
+        new_last_id = entries[-1][0]
+
+        return new_last_id, self._parse_entries(entries)
+
+    @staticmethod
+    def _parse_entries(entries: List[Any]) -> List[Dict[str, Any]]:
+        """Parse raw stream entries into event dicts, skipping malformed ones"""
         events = []
-        for event_str in event_strings:
+        for _entry_id, fields in entries:
             try:
-                events.append(json.loads(event_str))
-            except json.JSONDecodeError:
+                events.append(orjson.loads(fields["event"]))
+            except (KeyError, orjson.JSONDecodeError):
                 continue  # Skip malformed events
-        
         return events
-    
+
     async def get_total_events(self, workflow_id: str) -> int:
         """Get the total number of events in the stream"""
         stream_key = self._get_stream_key(workflow_id)
-        return await self.redis_client.llen(stream_key)
+        return await self.redis_client.xlen(stream_key)
     
     async def delete_stream(self, workflow_id: str) -> bool:
         """
@@ -2,9 +2,6 @@ import json
 import os
 from dataclasses import dataclass
 
-import uuid
-import argparse
-
 script_dir = os.path.dirname(__file__)
 relative_path = '../../data/investments.json'
 INVESTMENTS_FILE =  os.path.join(script_dir, relative_path)
@@ -38,8 +35,13 @@ class InvestmentManager:
 
     def _save_data(self):
         """Saves current investment client data to the JSON file."""
-        with open(self.json_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        # Serialize once and write a single preformatted blob; tmp file +
+        # os.replace keeps the write atomic.
+        buf = json.dumps(self.data, indent=2).encode()
+        tmp = self.json_file + '.tmp'
+        with open(tmp, 'wb', buffering=1 << 20) as f:
+            f.write(buf)
+        os.replace(tmp, self.json_file)
 
     def list_investment_accounts(self, client_id):
         """
@@ -57,6 +59,8 @@ class InvestmentManager:
         Automatically generates a unique investment_id.
         Creates the client_id if it doesn't exist.
         """
+        import uuid  # Deferred so library imports skip it
+
         try:
             if new_account.balance < 0:
                 print("Error: Balance cannot be negative.")
@@ -113,6 +117,8 @@ class InvestmentManager:
 
 
 def main():
+    import argparse  # CLI-only; deferred so library imports skip it
+
     parser = argparse.ArgumentParser(
         description="Manage your investment accounts via the command line."
     )
@@ -0,0 +1,74 @@
+"""
+Redis-backed, append-only persistence for agent message history.
+
+Keeping the full history only in RAM means a long-running supervisor holds
+every session's conversation in memory and loses it on restart. MessageLog
+stores each message as an immutable content-addressed blob (keyed by a
+blake2b digest of its serialized form) plus a per-session list of digests,
+so only *new* messages are serialized each turn and identical messages
+shared across sessions are stored once.
+"""
+
+import hashlib
+import logging
+from typing import List
+
+import redis.asyncio as redis
+
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
+
+from common.redis_config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+class MessageLog:
+    """Append-only message history for one chat session."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        config = RedisConfig()
+        self.redis_client = redis.Redis(host=config.hostname, port=config.port)
+
+    def _history_key(self) -> str:
+        """Redis key for the session's ordered list of message digests"""
+        return f"history:{self.session_id}"
+
+    @staticmethod
+    def _blob_key(digest: str) -> str:
+        """Redis key for a content-addressed message blob"""
+        return f"msg:{digest}"
+
+    async def load(self) -> List[ModelMessage]:
+        """Hydrate the session's history, in order. Empty list if none."""
+        digests = await self.redis_client.lrange(self._history_key(), 0, -1)
+        if not digests:
+            return []
+
+        blobs = await self.redis_client.mget(
+            [self._blob_key(d.decode()) for d in digests]
+        )
+
+        messages: List[ModelMessage] = []
+        for blob in blobs:
+            if blob is None:
+                continue  # Blob evicted - skip rather than fail the session
+            messages.extend(ModelMessagesTypeAdapter.validate_json(blob))
+        return messages
+
+    async def append(self, messages: List[ModelMessage]) -> None:
+        """Persist new messages; old ones are never re-serialized."""
+        if not messages:
+            return
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for message in messages:
+            blob = ModelMessagesTypeAdapter.dump_json([message])
+            digest = hashlib.blake2b(blob, digest_size=16).hexdigest()
+            # SET is idempotent - identical messages dedup to one blob
+            pipe.set(self._blob_key(digest), blob)
+            pipe.rpush(self._history_key(), digest)
+        await pipe.execute()
+
+    async def close(self):
+        """Close the Redis connection"""
+        await self.redis_client.aclose()
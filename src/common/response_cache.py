@@ -0,0 +1,109 @@
+"""
+Cache for agent responses to repeated identical requests.
+
+Every agent.run() call is a full LLM round trip, even when the user repeats
+an idempotent read like "list my beneficiaries". This module caches completed
+runs keyed on (agent name, system prompt digest, client id, canonicalized
+user input) - deliberately NOT on the message history, which grows every
+turn and carries per-message timestamps, so including it would make every
+key unique and the cache structurally useless. Staleness is bounded by the
+TTL and by the mutating tools invalidating their client's entries.
+
+Routing turns (where the output function signals a handoff) are never cached,
+since replaying them would skip the routing side effects.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CachedRunResult:
+    """A cache hit, shaped like the slice of AgentRunResult the loops use."""
+    output: str
+    _new_messages_json: bytes
+    client_id: Optional[str] = None
+    cached_at: float = field(default_factory=time.monotonic)
+
+    def new_messages(self) -> List[ModelMessage]:
+        return ModelMessagesTypeAdapter.validate_json(self._new_messages_json)
+
+class AgentResponseCache:
+    """
+    Bounded in-process LRU cache of (agent state) -> (response, new messages).
+
+    The cached messages are stored serialized so hits hand back fresh objects
+    rather than aliasing a previous turn's history.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, CachedRunResult] = OrderedDict()
+
+    def make_key(
+        self,
+        agent_name: str,
+        user_input: str,
+        client_id: Optional[str],
+        system_prompt_sha: str = "",
+    ) -> str:
+        """Hash the repeat-stable parts of a request into one key."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(agent_name.encode())
+        hasher.update(b"\x00")
+        hasher.update(system_prompt_sha.encode())
+        hasher.update(b"\x00")
+        hasher.update((client_id or "").encode())
+        hasher.update(b"\x00")
+        hasher.update(user_input.strip().lower().encode())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedRunResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        # Reads are only safe to serve for a bounded window
+        if time.monotonic() - entry.cached_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        logger.debug(f"Response cache hit for {key}")
+        return entry
+
+    def set(
+        self,
+        key: str,
+        output: str,
+        new_messages: List[ModelMessage],
+        client_id: Optional[str] = None,
+    ) -> None:
+        self._entries[key] = CachedRunResult(
+            output=output,
+            _new_messages_json=ModelMessagesTypeAdapter.dump_json(new_messages),
+            client_id=client_id,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, client_id: Optional[str]) -> None:
+        """Drop every cached response for a client after a mutation."""
+        if client_id is None:
+            return
+        stale = [k for k, e in self._entries.items() if e.client_id == client_id]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses for client {client_id}")
+
+# Process-wide cache shared between the chat loop (lookups) and the mutating
+# agent tools (invalidation).
+shared_cache = AgentResponseCache()
@@ -1,11 +1,16 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel
-
-class ProcessUserMessageInput(BaseModel):
+@dataclass
+class ProcessUserMessageInput:
     user_input: str
 
+    def __post_init__(self):
+        # Manual validation instead of pydantic - a single str field doesn't
+        # justify the BaseModel import cost for library consumers.
+        if not isinstance(self.user_input, str):
+            raise TypeError(f"user_input must be a str, got {type(self.user_input).__name__}")
+
 @dataclass
 class ChatInteraction:
     user_prompt: str
@@ -1,18 +1,121 @@
 import asyncio
 import logging
-import datetime
+import os
+import re
 
-from typing import List
+from dataclasses import replace
+from typing import List, Optional
 
 from pydantic_ai import Agent, ModelMessage
-from pydantic_ai.messages import ModelRequest, UserPromptPart
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
 
-from common.agent_constants import SUPERVISOR_AGENT_NAME, BENE_AGENT_NAME, INVEST_AGENT_NAME
+from common.agent_constants import (
+    SUPERVISOR_AGENT_NAME, BENE_AGENT_NAME, INVEST_AGENT_NAME,
+    AGENT_PROMPT_SHAS
+)
 from common.agents import (
     AgentDependencies,
+    BENE_HANDOFF_TRIGGER,
+    INVEST_HANDOFF_TRIGGER,
     supervisor_agent,
     beneficiary_agent,
-    investment_agent
+    investment_agent,
+    get_beneficiaries_mgr,
+    get_investment_mgr,
+    warm_client_caches
+)
+from common.message_log import MessageLog
+from common.response_cache import shared_cache
+
+# Commands that end the chat loop. Hoisted to a module-level frozenset so the
+# per-turn check allocates nothing.
+EXIT_CMDS = frozenset({"exit", "end", "quit"})
+
+# Agent registry: one precomputed dict lookup for dispatch instead of a
+# chain of string compares, and a single place to add new agents.
+AGENT_REGISTRY = {
+    SUPERVISOR_AGENT_NAME: supervisor_agent,
+    BENE_AGENT_NAME: beneficiary_agent,
+    INVEST_AGENT_NAME: investment_agent,
+}
+
+# Cheap local classifier for likely-beneficiary turns, used to speculatively
+# warm the beneficiary agent while the supervisor makes its routing decision.
+# Speculation is additionally restricted to list-looking turns (see below):
+# a speculative run may be cancelled or discarded, which is only safe when
+# the run cannot reach a mutating tool.
+BENEFICIARY_HINT = re.compile(r"benefic", re.IGNORECASE)
+
+# Deterministic first-pass router. Routine turns ("list my beneficiaries",
+# "show my investments") don't need an inference round trip to route; only
+# ambiguous input falls through to the supervisor LLM call. The input is
+# tokenized once and matched with C-level frozenset intersections instead of
+# per-keyword substring scans.
+_WORD_RE = re.compile(r"[a-z]+")
+BENE_KEYWORDS = frozenset({"beneficiary", "beneficiaries"})
+INVEST_KEYWORDS = frozenset({"investment", "investments", "invest"})
+
+INTENT_TRIGGERS = {
+    BENE_AGENT_NAME: BENE_HANDOFF_TRIGGER,
+    INVEST_AGENT_NAME: INVEST_HANDOFF_TRIGGER,
+}
+
+def intent_tokens(text: str) -> frozenset:
+    """Tokenize the input once for all keyword checks."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+def classify_intent(text: str):
+    """Return a definite target agent name, or None when ambiguous."""
+    tokens = intent_tokens(text)
+    is_bene = bool(tokens & BENE_KEYWORDS)
+    is_invest = bool(tokens & INVEST_KEYWORDS)
+    if is_bene != is_invest:
+        return BENE_AGENT_NAME if is_bene else INVEST_AGENT_NAME
+    return None
+
+# Plain list requests need no reasoning at all: fetch from the manager and
+# render the agents' mandated formats directly, skipping the LLM round trip.
+LIST_INTENT_RE = re.compile(r"\b(list|show|who are|what are)\b", re.IGNORECASE)
+
+def format_beneficiary_list(beneficiaries: list) -> str:
+    """Render the beneficiary agent's mandated list format."""
+    lines = [
+        f"{idx}. {b['first_name']} {b['last_name']} ({b['relationship']})"
+        for idx, b in enumerate(beneficiaries, 1)
+    ]
+    return ("Here are your current beneficiaries:\n\n"
+            + "\n".join(lines)
+            + "\n\nWould you like to add, remove or list your beneficiaries?")
+
+def format_investment_list(accounts: list) -> str:
+    """Render the investment agent's mandated list format."""
+    lines = [
+        f"{idx}. {a['name']}: ${a['balance']:,.2f}"
+        for idx, a in enumerate(accounts, 1)
+    ]
+    return ("Here are your investment accounts:\n\n"
+            + "\n".join(lines)
+            + "\n\nWould you like to open, close or list your investment accounts?")
+
+# Bound on chained handoffs per turn - a misbehaving model bouncing between
+# agents would otherwise burn LLM calls forever.
+MAX_HANDOFF_DEPTH = 5
+
+# History compaction: past MAX_HISTORY_MESSAGES, everything but the most
+# recent KEEP_RECENT_MESSAGES is folded into a single summary message so
+# per-turn prompt cost stays flat instead of growing quadratically with
+# conversation length.
+MAX_HISTORY_MESSAGES = 40
+KEEP_RECENT_MESSAGES = 20
+
+summarizer_agent = Agent(
+    'openai:gpt-4.1-mini',
+    name="History Summarizer",
+    system_prompt=(
+        "Summarize the conversation so far in one short paragraph. "
+        "Preserve the client id, any names, account details, amounts, "
+        "and any pending confirmations."
+    ),
 )
 
 ### Logging Configuration
@@ -33,19 +136,45 @@ def debug_print(message: str):
 
 
 class PydanticAIWealthManagement:
-    def __init__(self):
-        self.agent_deps = AgentDependencies()
+    def __init__(self, message_log: Optional[MessageLog] = None):
         self.message_history: List[ModelMessage] = []
+        # Deps share the history list for the life of the session, so the
+        # routing loop never needs to re-sync the reference per iteration
+        self.agent_deps = AgentDependencies(message_history=self.message_history)
+        # Shared with the mutating agent tools, which invalidate per client
+        self.response_cache = shared_cache
+        # Optional Redis-backed persistence; only new messages are written
+        # each turn, so old history is never re-serialized
+        self.message_log = message_log
 
     async def run_agent_loop(self):
+        # Pick up where a previous session with this id left off. Extend in
+        # place - agent_deps holds a reference to this same list.
+        if self.message_log:
+            self.message_history.extend(await self.message_log.load())
+
         print("Welcome to ABC Wealth Management. How can I help you?")
 
         while True:
-            user_input = input(f"\n[{self.agent_deps.current_agent_name}] Enter your message: ")
+            # While blocked on stdin, speculatively warm the client data the
+            # next turn will most likely need - human think time is free
+            if self.agent_deps.client_id:
+                asyncio.create_task(self._prefetch_client_data())
+
+            # Read stdin off the event loop so background work (speculative
+            # dispatch, prefetch, pending tasks) keeps progressing while the
+            # user types
+            user_input = await asyncio.to_thread(
+                input, f"\n[{self.agent_deps.current_agent_name}] Enter your message: ")
 
-            if user_input.lower() in {"exit", "end", "quit"}:
+            # Length check first skips the .lower() allocation on normal input
+            if len(user_input) <= 4 and user_input.lower() in EXIT_CMDS:
                 break
 
+            # An empty line shouldn't cost an LLM call
+            if not user_input.strip():
+                continue
+
             await self._process_user_message(user_input)
 
         print("Agent loop complete.")
@@ -54,46 +183,144 @@ class PydanticAIWealthManagement:
         """Process a user message through the agent system with routing."""
         debug_print(f"Processing user message: {user_input}")
 
-        # Add user message to history
+        # Add user message to history. The timestamp is deliberately left to
+        # the UserPromptPart default (frozen once per turn) - stamping it
+        # ourselves on every turn shifts the token prefix and defeats
+        # provider-side prompt caching.
         user_message = ModelRequest(
-            parts=[UserPromptPart(
-                content=user_input,
-                timestamp=datetime.datetime.now(datetime.timezone.utc)
-            )]
+            parts=[UserPromptPart(content=user_input)]
         )
         self.message_history.append(user_message)
+        await self._record([user_message])
 
         # Start with supervisor agent
-        current_agent = self._get_current_agent()
         current_input = user_input
 
-        # Loop to handle chain routing
-        while True:
-            # Sync message history to deps before running agent (for confirmation checking)
-            self.agent_deps.message_history = self.message_history
+        # Compound list turns ("list my beneficiaries and my investments")
+        # would otherwise cost two full supervisor->specialist round trips;
+        # serve both stores in one parallel pass instead
+        tokens = intent_tokens(user_input)
+        if (self.agent_deps.current_agent_name == SUPERVISOR_AGENT_NAME
+                and self.agent_deps.client_id
+                and LIST_INTENT_RE.search(user_input)
+                and tokens & BENE_KEYWORDS and tokens & INVEST_KEYWORDS):
+            if await self._answer_compound_list():
+                return
+
+        # Deterministic routing for routine turns: when the intent is
+        # unambiguous and the client id is already known, hand off directly
+        # instead of paying the supervisor LLM call to make the decision
+        if (self.agent_deps.current_agent_name == SUPERVISOR_AGENT_NAME
+                and self.agent_deps.client_id):
+            intent = classify_intent(user_input)
+            if intent is not None:
+                debug_print(f"\n>>> Classifier routing: {SUPERVISOR_AGENT_NAME} → {intent}")
+                self.agent_deps.current_agent_name = intent
+                current_input = INTENT_TRIGGERS[intent]
+
+                # Plain list request: answer straight from the store, no LLM
+                if LIST_INTENT_RE.search(user_input):
+                    if await self._answer_list_directly(intent):
+                        return
+
+        current_agent = self._get_current_agent()
+
+        # Speculatively dispatch the beneficiary agent alongside the
+        # supervisor's routing turn. On the common routed path both LLM
+        # round trips overlap (one RTT instead of two); on a mispredict the
+        # speculative call is discarded. Only read-only-looking turns are
+        # speculated: an add/remove turn could reach a mutating tool inside
+        # a run we then cancel or throw away, silently writing to the store
+        # with no record in history.
+        speculation = None
+        if (self.agent_deps.current_agent_name == SUPERVISOR_AGENT_NAME
+                and self.agent_deps.client_id
+                and BENEFICIARY_HINT.search(user_input)
+                and LIST_INTENT_RE.search(user_input)):
+            spec_deps = replace(self.agent_deps, current_agent_name=BENE_AGENT_NAME)
+            spec_task = asyncio.create_task(beneficiary_agent.run(
+                BENE_HANDOFF_TRIGGER,
+                deps=spec_deps,
+                message_history=list(self.message_history)
+            ))
+            speculation = (spec_task, spec_deps)
+
+        # Loop to handle chain routing, bounded by MAX_HANDOFF_DEPTH
+        for _depth in range(MAX_HANDOFF_DEPTH):
+            # Only iterations driven by the user's own text touch the cache.
+            # After a route (classifier or handoff) the input is a constant
+            # trigger string, so every routed turn for a client would share
+            # one key and replay an earlier request's answer.
+            cacheable_turn = current_input == user_input
+
+            result = None
+            if cacheable_turn:
+                # Check the response cache before paying for an LLM round trip
+                cache_key = self.response_cache.make_key(
+                    agent_name=self.agent_deps.current_agent_name,
+                    user_input=user_input,
+                    client_id=self.agent_deps.client_id,
+                    system_prompt_sha=AGENT_PROMPT_SHAS.get(self.agent_deps.current_agent_name, "")
+                )
+                result = self.response_cache.get(cache_key)
+
+            if result is None:
+                # Run the current agent
+                self.agent_deps.mutated = False
+                result = await current_agent.run(
+                    current_input,
+                    deps=self.agent_deps,
+                    message_history=self.message_history
+                )
 
-            # Run the current agent
-            result = await current_agent.run(
-                current_input,
-                deps=self.agent_deps,
-                message_history=self.message_history
-            )
+                # Only cache terminal, read-only responses - replaying a
+                # routing turn would skip the handoff side effects, and
+                # replaying a mutating turn (e.g. a "yes" that confirmed a
+                # deletion) would print success without performing the write
+                if (cacheable_turn
+                        and not self.agent_deps.next_agent
+                        and not self.agent_deps.mutated):
+                    self.response_cache.set(
+                        cache_key, result.output, result.new_messages(),
+                        client_id=self.agent_deps.client_id)
 
             # Add agent's new messages to history
-            self.message_history.extend(result.new_messages())
+            new_messages = result.new_messages()
+            self.message_history.extend(new_messages)
+            await self._record(new_messages)
 
             # Check if output function signaled a route
             if self.agent_deps.next_agent:
-                # Routing detected - switch to next agent
-                debug_print(f"\n>>> Routing: {self.agent_deps.current_agent_name} → {self.agent_deps.next_agent}")
+                # A self-handoff is a cycle, not a route - treat as terminal
+                if self.agent_deps.next_agent == self.agent_deps.current_agent_name:
+                    debug_print(f"Ignoring self-handoff to {self.agent_deps.next_agent}")
+                    self.agent_deps.next_agent = None
+                    self.agent_deps.trigger_message = None
+                    if result.output and result.output.strip():
+                        print(result.output)
+                    break
 
-                self.agent_deps.current_agent_name = self.agent_deps.next_agent
-                current_agent = self._get_current_agent()
-                current_input = self.agent_deps.trigger_message
+                # Routing detected - switch to next agent
+                current_agent, current_input = self._apply_handoff()
 
-                # Clear routing state
-                self.agent_deps.next_agent = None
-                self.agent_deps.trigger_message = None
+                # If the routed-to answer is already in flight, adopt it
+                if speculation is not None:
+                    spec_task, spec_deps = speculation
+                    speculation = None
+                    if (self.agent_deps.current_agent_name == BENE_AGENT_NAME):
+                        spec_result = await spec_task
+                        if not spec_deps.next_agent:
+                            spec_messages = spec_result.new_messages()
+                            self.message_history.extend(spec_messages)
+                            await self._record(spec_messages)
+                            if spec_result.output and spec_result.output.strip():
+                                print(spec_result.output)
+                            break
+                        # Speculative run routed elsewhere - fall through and
+                        # run the beneficiary agent normally
+                    else:
+                        # Mispredicted - discard the speculative call
+                        spec_task.cancel()
 
                 # Continue loop to process next agent
                 continue
@@ -102,19 +329,174 @@ class PydanticAIWealthManagement:
                 if result.output and result.output.strip():
                     print(result.output)
                 break
+        else:
+            logger.warning(f"Handoff chain exceeded {MAX_HANDOFF_DEPTH} hops; giving up")
+            print("I encountered a problem routing your request. Please try again.")
+
+        # Supervisor answered directly - the speculative call is unused
+        if speculation is not None:
+            speculation[0].cancel()
+
+        # Once the client identifies themselves, bind persistence to the
+        # client id so a returning client resumes their conversation instead
+        # of re-introducing themselves (skipped when an explicit session id
+        # was configured)
+        if self.message_log is None and self.agent_deps.client_id:
+            await self._bind_client_log()
+
+        # Keep the prompt size bounded
+        await self._compact_history()
+
+    async def _answer_list_directly(self, intent: str) -> bool:
+        """
+        Serve a plain list request straight from the manager, bypassing the
+        handoff LLM call. Returns False (caller falls back to the agent) when
+        the store comes back empty, so the agent can phrase that case.
+        """
+        if intent == BENE_AGENT_NAME:
+            beneficiaries = await asyncio.to_thread(
+                get_beneficiaries_mgr().list_beneficiaries, self.agent_deps.client_id)
+            if not beneficiaries:
+                return False
+            response = format_beneficiary_list(beneficiaries)
+        else:
+            accounts = await asyncio.to_thread(
+                get_investment_mgr().list_investment_accounts, self.agent_deps.client_id)
+            if not accounts:
+                return False
+            response = format_investment_list(accounts)
+
+        await self._emit_direct_response(response)
+        return True
+
+    async def _answer_compound_list(self) -> bool:
+        """
+        Serve a both-stores list request in one turn, reading the managers in
+        parallel. Returns False (caller falls back to the agents) when either
+        store is empty.
+        """
+        beneficiaries, accounts = await asyncio.gather(
+            asyncio.to_thread(
+                get_beneficiaries_mgr().list_beneficiaries, self.agent_deps.client_id),
+            asyncio.to_thread(
+                get_investment_mgr().list_investment_accounts, self.agent_deps.client_id),
+        )
+        if not beneficiaries or not accounts:
+            return False
+
+        response = (format_beneficiary_list(beneficiaries)
+                    + "\n\n"
+                    + format_investment_list(accounts))
+        await self._emit_direct_response(response)
+        return True
+
+    async def _emit_direct_response(self, response: str):
+        """Print a synthesized response and record it in history."""
+        # Record the synthesized turn so the agents see a coherent history
+        response_message = ModelResponse(parts=[TextPart(content=response)])
+        self.message_history.append(response_message)
+        await self._record([response_message])
+
+        print(response)
+
+    async def _bind_client_log(self):
+        """
+        Attach a per-client message log: hydrate any prior conversation in
+        front of this session's turns and backfill what has happened so far.
+        """
+        self.message_log = MessageLog(f"client:{self.agent_deps.client_id}")
+        try:
+            prior = await self.message_log.load()
+            current_session = list(self.message_history)
+            if prior:
+                self.message_history[:0] = prior
+            await self.message_log.append(current_session)
+        except Exception as e:
+            # Persistence is an enhancement - never fail the chat over it
+            logger.warning(f"Could not bind client message log: {e}")
+            self.message_log = None
+
+    async def _prefetch_client_data(self):
+        """Speculatively warm the tool caches during user think time."""
+        try:
+            await warm_client_caches(self.agent_deps.client_id)
+        except Exception as e:
+            # Prefetch is best-effort - the real tool call will surface errors
+            debug_print(f"Prefetch failed: {e}")
+
+    async def _record(self, messages: List[ModelMessage]):
+        """Persist new messages when a message log is configured."""
+        if self.message_log:
+            await self.message_log.append(messages)
+
+    async def _compact_history(self):
+        """Fold all but the most recent turns into a one-message summary."""
+        if len(self.message_history) <= MAX_HISTORY_MESSAGES:
+            return
+
+        # Keep the last KEEP_RECENT_MESSAGES verbatim, cutting only at a
+        # user-turn boundary so tool calls stay paired with their returns
+        # in what remains.
+        cut = None
+        for idx in range(len(self.message_history) - KEEP_RECENT_MESSAGES, len(self.message_history)):
+            msg = self.message_history[idx]
+            if isinstance(msg, ModelRequest) and any(
+                    isinstance(part, UserPromptPart) for part in msg.parts):
+                cut = idx
+                break
+        if cut is None:
+            return
+
+        debug_print(f"Compacting {cut} history messages into a summary")
+
+        result = await summarizer_agent.run(
+            "Summarize this conversation.",
+            message_history=self.message_history[:cut]
+        )
+        summary_message = ModelRequest(parts=[UserPromptPart(
+            content=f"[Conversation summary: {result.output}]"
+        )])
+        self.message_history[:cut] = [summary_message]
+
+    def _apply_handoff(self):
+        """
+        Switch to the routed-to agent and clear the routing signal.
+        Returns the (agent, input) pair for the next loop iteration.
+        """
+        debug_print(f"\n>>> Routing: {self.agent_deps.current_agent_name} → {self.agent_deps.next_agent}")
+
+        self.agent_deps.current_agent_name = self.agent_deps.next_agent
+        current_input = self.agent_deps.trigger_message
+
+        # Clear routing state
+        self.agent_deps.next_agent = None
+        self.agent_deps.trigger_message = None
+
+        return self._get_current_agent(), current_input
 
     def _get_current_agent(self) -> Agent:
         """Get the agent instance based on current_agent_name."""
-        if self.agent_deps.current_agent_name == BENE_AGENT_NAME:
-            return beneficiary_agent
-        elif self.agent_deps.current_agent_name == INVEST_AGENT_NAME:
-            return investment_agent
-        else:
-            return supervisor_agent
+        return AGENT_REGISTRY.get(self.agent_deps.current_agent_name, supervisor_agent)
 
 async def main():
-    wealth_management_flow = PydanticAIWealthManagement()
-    await wealth_management_flow.run_agent_loop()
+    # Set CHAT_SESSION_ID to persist the conversation in Redis and resume it
+    # across restarts; unset, history stays in memory as before
+    session_id = os.getenv("CHAT_SESSION_ID")
+    message_log = MessageLog(session_id) if session_id else None
+
+    wealth_management_flow = PydanticAIWealthManagement(message_log=message_log)
+    try:
+        await wealth_management_flow.run_agent_loop()
+    finally:
+        if message_log:
+            await message_log.close()
 
 if __name__ == "__main__":
-     asyncio.run(main())
+    # The whole loop is I/O-bound (LLM HTTP, Redis); uvloop cuts event loop
+    # overhead when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(main())
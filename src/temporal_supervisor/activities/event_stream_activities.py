@@ -1,3 +1,6 @@
+import asyncio
+from typing import Optional
+
 from temporalio import activity
 from temporalio.workflow import logger
 
@@ -5,6 +8,20 @@ from common.event_stream_manager import EventStreamManager, EventType
 from common.user_message import ChatInteraction
 from common.status_update import StatusUpdate
 
+# One manager - and its underlying Redis connection pool - per worker
+# process. Constructing and closing a client inside every activity paid a
+# TCP handshake on each chat turn.
+_manager: Optional[EventStreamManager] = None
+_manager_lock = asyncio.Lock()
+
+async def _get_manager() -> EventStreamManager:
+    global _manager
+    if _manager is None:
+        async with _manager_lock:
+            if _manager is None:
+                _manager = EventStreamManager()
+    return _manager
+
 class EventStreamActivities:
     """
     Activities for event stream operations.
@@ -16,39 +33,42 @@ class EventStreamActivities:
     @activity.defn
     async def append_chat_interaction(workflow_id: str, chat_interaction: ChatInteraction) -> int:
         """Append a chat interaction to the event stream"""
-        manager = EventStreamManager()
-        try:
-            sequence = await manager.append_chat_interaction(
-                workflow_id=workflow_id,
-                chat_interaction=chat_interaction
-            )
-            activity.logger.info(f"Appended chat interaction to stream {workflow_id}, sequence {sequence}")
-            return sequence
-        finally:
-            await manager.close()
+        manager = await _get_manager()
+        sequence = await manager.append_chat_interaction(
+            workflow_id=workflow_id,
+            chat_interaction=chat_interaction
+        )
+        activity.logger.info(f"Appended chat interaction to stream {workflow_id}, sequence {sequence}")
+        return sequence
     
+    @staticmethod
+    @activity.defn
+    async def append_chat_interactions(workflow_id: str, chat_interactions: list[ChatInteraction]) -> int:
+        """Append a batch of chat interactions to the event stream"""
+        manager = await _get_manager()
+        sequence = await manager.append_chat_interactions(
+            workflow_id=workflow_id,
+            chat_interactions=chat_interactions
+        )
+        activity.logger.info(f"Appended {len(chat_interactions)} chat interactions to stream {workflow_id}, sequence {sequence}")
+        return sequence
+
     @staticmethod
     @activity.defn
     async def append_status_update(workflow_id: str, status_update: StatusUpdate) -> int:
         """Append a status update to the event stream"""
-        manager = EventStreamManager()
-        try:
-            sequence = await manager.append_status_update(
-                workflow_id=workflow_id,
-                status_update=status_update
-            )
-            activity.logger.info(f"Appended status update to stream {workflow_id}, sequence {sequence}")
-            return sequence
-        finally:
-            await manager.close()
+        manager = await _get_manager()
+        sequence = await manager.append_status_update(
+            workflow_id=workflow_id,
+            status_update=status_update
+        )
+        activity.logger.info(f"Appended status update to stream {workflow_id}, sequence {sequence}")
+        return sequence
     
 
     @staticmethod
     @activity.defn
     async def delete_conversation(workflow_id: str) -> bool:
         """Delete the conversation for a workflow"""
-        manager = EventStreamManager()
-        try:
-            return await manager.delete_stream(workflow_id)
-        finally:
-            await manager.close()
\ No newline at end of file
+        manager = await _get_manager()
+        return await manager.delete_stream(workflow_id)
\ No newline at end of file
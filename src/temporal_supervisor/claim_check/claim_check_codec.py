@@ -1,5 +1,7 @@
+import asyncio
 import uuid
 import redis.asyncio as redis
+from collections import OrderedDict
 from typing import Iterable, List, Optional
 
 from temporalio.api.common.v1 import Payload
@@ -7,50 +9,139 @@ from temporalio.converter import PayloadCodec
 
 from common.redis_config import RedisConfig
 
+class _BatchedReader:
+    """
+    Coalesces concurrent GETs into shared MGET round trips.
+
+    A burst of activity completions decodes one or two payloads each;
+    holding a request for a couple of milliseconds lets the whole burst
+    share a single MGET instead of paying one Redis round trip apiece.
+    """
+
+    WINDOW_S = 0.002
+    MAX_BATCH = 128
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self._pending: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get_many(self, keys: List[bytes]) -> List[Optional[bytes]]:
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in keys]
+        self._pending.extend(zip(keys, futures))
+
+        if len(self._pending) >= self.MAX_BATCH:
+            await self._flush()
+        elif self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_later())
+
+        return list(await asyncio.gather(*futures))
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.WINDOW_S)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        try:
+            values = await self.redis_client.mget([key for key, _ in pending])
+        except Exception as e:
+            for _, fut in pending:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        for (_, fut), value in zip(pending, values):
+            if not fut.done():
+                fut.set_result(value)
+
 #
 # Substitutes the payload for a GUID
 # and stores the original payload in Redis
 #
 class ClaimCheckCodec(PayloadCodec):
 
+    # Workflow replays decode the same claim-check ids over and over; a
+    # bounded in-process LRU serves those repeats without a Redis round trip.
+    MAX_CACHE_ENTRIES = 4096
+
     def __init__(self):
         config = RedisConfig()
         self.redis_client = redis.Redis(host=config.hostname, port=config.port)
+        self._decode_cache: OrderedDict = OrderedDict()
+        self._reader = _BatchedReader(self.redis_client)
 
     #
     # TODO: Figure out when/how to close the redis_client
     #       Can't be done in a __del__ as it aClose() needs to be awaited
     #
     async def encode(self, payloads: Iterable[Payload]) -> List[Payload]:
-        out: list[Payload] = []
-        for p in payloads:
-            encoded = await self.encode_payload(p)
-            out.append(encoded)
+        payloads = list(payloads)
+        # Raw 16-byte uuids: redis accepts bytes keys, so skip the 36-char
+        # string formatting and utf-8 encode per payload
+        ids = [uuid.uuid4().bytes for _ in payloads]
 
-        return out
+        # One pipelined round trip for all the SETs instead of one RTT each
+        pipe = self.redis_client.pipeline(transaction=False)
+        for redis_id, p in zip(ids, payloads):
+            pipe.set(redis_id, p.SerializeToString())
+        await pipe.execute()
+
+        return [
+            Payload(
+                metadata={
+                    "encoding": b"claim-checked",
+                    "temporal.io/claim-check-codec": b"v1",
+                },
+                data=redis_id,
+            )
+            for redis_id in ids
+        ]
 
     async def decode(self, payloads: Iterable[Payload]) -> List[Payload]:
-        out: List[Payload] = []
+        out: List[Optional[Payload]] = []
+        claim_indices: List[int] = []
+        redis_ids: List[bytes] = []
         for p in payloads:
             if p.metadata.get("temporal.io/claim-check-codec", b"").decode() != "v1":
                 out.append(p)
                 continue
+            # The id is used as-is; payloads written before the switch to
+            # raw uuid bytes look up under the same key bytes either way
+            redis_id = p.data
+            cached = self._decode_cache.get(redis_id)
+            if cached is not None:
+                self._decode_cache.move_to_end(redis_id)
+                out.append(cached)
+                continue
+            claim_indices.append(len(out))
+            redis_ids.append(redis_id)
+            out.append(None)
 
-            redis_id = p.data.decode("utf-8")
-            value = await self.redis_client.get(redis_id)
-            new_payload = Payload.FromString(value)
-            out.append(new_payload)
-        return out
+        if redis_ids:
+            # Reads go through the batching reader: this call's ids share one
+            # MGET, and concurrent decodes from other activities coalesce
+            # into the same round trip
+            values = await self._reader.get_many(redis_ids)
+            for redis_id, idx, value in zip(redis_ids, claim_indices, values):
+                decoded = Payload.FromString(value)
+                out[idx] = decoded
+                self._cache_decoded(redis_id, decoded)
 
-    async def encode_payload(self, payload: Payload) -> Payload:
-        id = str(uuid.uuid4())
-        value = payload.SerializeToString()
-        await self.redis_client.set(id, value)
-        out = Payload(
-            metadata= {
-                "encoding": b"claim-checked",
-                "temporal.io/claim-check-codec": b"v1",
-            },
-            data=id.encode("utf-8"),
-        )
         return out
+
+    def _cache_decoded(self, redis_id: bytes, payload: Payload):
+        """Remember a decoded payload, evicting least-recently-used first."""
+        self._decode_cache[redis_id] = payload
+        self._decode_cache.move_to_end(redis_id)
+        while len(self._decode_cache) > self.MAX_CACHE_ENTRIES:
+            self._decode_cache.popitem(last=False)
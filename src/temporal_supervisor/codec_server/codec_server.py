@@ -22,23 +22,32 @@ def build_codec_server() -> web.Application:
     async def apply(
         fn: Callable[[Iterable[Payload]], Awaitable[List[Payload]]], req: web.Request
     ) -> web.Response:
-        # Read payloads as JSON
-        assert req.content_type == "application/json"
         data = await req.read()
+
+        # Binary protobuf skips the reflection-based JSON codec entirely -
+        # ParseFromString/SerializeToString run in the C-accelerated backend
+        if req.content_type == "application/x-protobuf":
+            payloads = Payloads()
+            payloads.ParseFromString(data)
+            payloads = Payloads(payloads=await fn(payloads.payloads))
+
+            resp = await cors_options(req)
+            resp.content_type = "application/x-protobuf"
+            resp.body = payloads.SerializeToString()
+            return resp
+
+        # Read payloads as JSON (what the Temporal UI sends)
+        assert req.content_type == "application/json"
         payloads = json_format.Parse(data, Payloads())
-        # print("----- Request -------")
-        # print(payloads)
-        # print("---------------------")
+
         # Apply
         payloads = Payloads(payloads=await fn(payloads.payloads))
 
-        # Apply CORS and return JSON
+        # Apply CORS and return compact JSON - pretty-printing the payload
+        # blobs is pure wasted serialization work
         resp = await cors_options(req)
         resp.content_type = "application/json"
-        resp.text = json_format.MessageToJson(payloads)
-        # print("------ Response -----")
-        # print(f"{resp.text}")
-        # print("---------------------")
+        resp.text = json_format.MessageToJson(payloads, indent=None)
 
         return resp
 
@@ -56,4 +65,11 @@ def build_codec_server() -> web.Application:
 
 
 if __name__ == "__main__":
+    # The codec server is pure Redis + HTTP I/O; uvloop cuts event loop
+    # overhead when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     web.run_app(build_codec_server(), host="127.0.0.1", port=8081)
\ No newline at end of file
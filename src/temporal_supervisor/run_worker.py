@@ -25,25 +25,38 @@ async def main():
     
     client_helper = ClientHelper()
     plugins = [ PydanticAIPlugin(), ClaimCheckPlugin() ]
-    print(f"address is {client_helper.address} and plugins are {plugins}")
+    logging.info("address is %s and plugins are %s", client_helper.address, plugins)
     client = await Client.connect(**client_helper.client_config,
                                   plugins=plugins)
 
     worker = Worker(
         client,
-        task_queue=client_helper.taskQueue, 
+        task_queue=client_helper.taskQueue,
         workflows=[
             WealthManagementWorkflow,
         ],
         activities=[
             EventStreamActivities.append_chat_interaction,
+            EventStreamActivities.append_chat_interactions,
             EventStreamActivities.append_status_update,
             EventStreamActivities.delete_conversation,
         ],
+        # The activities are short async Redis appends; raise the caps so a
+        # burst of chat turns across workflows flushes in parallel instead
+        # of queueing behind the defaults
+        max_concurrent_activities=256,
+        max_concurrent_workflow_tasks=64,
     )
 
-    print(f"Running worker on {client_helper.address}")
+    logging.info("Running worker on %s", client_helper.address)
     await worker.run()
 
 if __name__ == '__main__':
+    # Worker traffic is all gRPC and Redis I/O; uvloop cuts event loop
+    # overhead when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
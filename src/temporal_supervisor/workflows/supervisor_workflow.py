@@ -1,7 +1,6 @@
-import asyncio
-
+from collections import deque
 from datetime import timedelta
-from typing import List
+from typing import Deque, List
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
@@ -21,7 +20,7 @@ from common.agents import (
     investment_agent
 )
 
-from common.agent_constants import BENE_AGENT_NAME, INVEST_AGENT_NAME
+from common.agent_constants import SUPERVISOR_AGENT_NAME, BENE_AGENT_NAME, INVEST_AGENT_NAME
 from common.user_message import ProcessUserMessageInput, ChatInteraction
 
 from temporal_supervisor.activities.event_stream_activities import EventStreamActivities
@@ -30,52 +29,89 @@ temporal_super_agent = TemporalAgent(supervisor_agent)
 temporal_bene_agent = TemporalAgent(beneficiary_agent)
 temporal_invest_agent = TemporalAgent(investment_agent)
 
+# O(1) dispatch for the handoff path - mirrors the registry the CLI loop uses
+AGENT_MAP = {
+    SUPERVISOR_AGENT_NAME: temporal_super_agent,
+    BENE_AGENT_NAME: temporal_bene_agent,
+    INVEST_AGENT_NAME: temporal_invest_agent,
+}
+
+# Hoisted so the per-message (and per-replay) loop doesn't reallocate the
+# retry policy and its timedeltas on every iteration
+APPEND_TIMEOUT = timedelta(seconds=5)
+APPEND_RETRY = RetryPolicy(initial_interval=timedelta(seconds=1),
+        backoff_coefficient=2,
+        maximum_interval=timedelta(seconds=30))
+
 @workflow.defn
 class WealthManagementWorkflow(PydanticAIWorkflow):
     __pydantic_ai_agents__ = [temporal_super_agent, temporal_bene_agent, temporal_invest_agent]
-    
+
+    # Past HISTORY_MAX messages, agent calls receive only the most recent
+    # HISTORY_WINDOW (snapped to a user-turn boundary); the full record is
+    # retained for the get_chat_history query. The trimming is a pure
+    # function of the history, so it replays deterministically - an LLM
+    # summarizer is not an option inside workflow code.
+    HISTORY_MAX = 40
+    HISTORY_WINDOW = 20
+
+    # Bound on chained handoffs per message - a misbehaving model bouncing
+    # between agents would otherwise burn LLM calls and event history forever
+    MAX_HANDOFF_DEPTH = 5
+
     def __init__(self):
-        self.pending_chat_messages: asyncio.Queue = asyncio.Queue()
+        # A plain deque: wait_condition already supplies the wakeup, so
+        # asyncio.Queue's per-put future/lock machinery was pure overhead
+        self.pending_chat_messages: Deque[str] = deque()
         self.exit_workflow = False
-        self.agent_deps = AgentDependencies()
         self.message_history: List[ModelMessage] = []
+        # Deps share the history list for the life of the workflow, so the
+        # routing loop never needs to re-sync the reference per iteration
+        self.agent_deps = AgentDependencies(message_history=self.message_history)
 
     @workflow.run
     async def run(self):
         while True:
-            workflow.logger.info("At the top of the loop - waiting for messages or status updates")
-
             # wait for a queue item or end workflow
             await workflow.wait_condition(
-                lambda: not self.pending_chat_messages.empty() or self.exit_workflow
+                lambda: bool(self.pending_chat_messages) or self.exit_workflow
             )
 
             if self.exit_workflow:
                 workflow.logger.info("Ending workflow.")
                 return
 
-            # process chat messages
-            user_input = None
-            if not self.pending_chat_messages.empty():
-                user_input = self.pending_chat_messages.get_nowait()
-
-            chat_interaction = ChatInteraction(
-                user_prompt=user_input,
-                text_response=""
-            )
-
-            await self._process_user_message(chat_interaction=chat_interaction, 
-                user_input=user_input)
-
-            # save the history in Redis
-            await workflow.execute_local_activity(
-                EventStreamActivities.append_chat_interaction,
-                args=[workflow.info().workflow_id, chat_interaction],
-                schedule_to_close_timeout=timedelta(seconds=5),
-                retry_policy=RetryPolicy(initial_interval=timedelta(seconds=1),
-                        backoff_coefficient=2,
-                        maximum_interval=timedelta(seconds=30))
-            )
+            # Drain everything queued so a burst of messages shares one
+            # workflow-task iteration and one Redis append
+            batch: List[str] = []
+            while self.pending_chat_messages:
+                batch.append(self.pending_chat_messages.popleft())
+
+            # INVARIANT: messages must be processed sequentially. agent_deps
+            # (current agent, routing signal) and message_history mutate per
+            # message, so an asyncio.gather fan-out here would interleave
+            # routing state between turns. The batch drain above still
+            # amortizes the workflow-task overhead for bursts.
+            interactions: List[ChatInteraction] = []
+            for user_input in batch:
+                chat_interaction = ChatInteraction(
+                    user_prompt=user_input,
+                    text_response=""
+                )
+
+                await self._process_user_message(chat_interaction=chat_interaction,
+                    user_input=user_input)
+
+                interactions.append(chat_interaction)
+
+            # save the history in Redis - one batched append per iteration
+            if interactions:
+                await workflow.execute_local_activity(
+                    EventStreamActivities.append_chat_interactions,
+                    args=[workflow.info().workflow_id, interactions],
+                    schedule_to_close_timeout=APPEND_TIMEOUT,
+                    retry_policy=APPEND_RETRY
+                )
 
     @workflow.query
     def get_chat_history(self) -> list[ModelMessage]:
@@ -87,11 +123,19 @@ class WealthManagementWorkflow(PydanticAIWorkflow):
 
     @workflow.signal
     async def process_user_message(self, message_input: ProcessUserMessageInput):
-        workflow.logger.info(f"Received user message {message_input}")
-        await self.pending_chat_messages.put(message_input.user_input)
+        workflow.logger.info("Received user message %s", message_input)
+        # Don't enqueue blank signals - each one would cost a full LLM call
+        if not message_input.user_input or not message_input.user_input.strip():
+            return
+        self.pending_chat_messages.append(message_input.user_input)
 
     async def _process_user_message(self, chat_interaction: ChatInteraction, user_input: str):
-        workflow.logger.info(f"Processing user message of {user_input}")
+        workflow.logger.info("Processing user message of %s", user_input)
+
+        # Belt and braces behind the signal-side guard
+        if not user_input or not user_input.strip():
+            chat_interaction.text_response = ""
+            return
 
         # Add user input to history before running agent
         user_message = ModelRequest(
@@ -102,25 +146,21 @@ class WealthManagementWorkflow(PydanticAIWorkflow):
         )
         self.message_history.append(user_message)
 
-        # Start with supervisor agent
         # Start with supervisor agent
         current_agent = self._get_current_agent()
         current_input = user_input
 
         response = ""
-        # Loop to handle chain routing
-        while True:
-            # Sync message history to deps BEFORE running agent
-            # (so tools can access confirmation messages in context.deps.message_history)
-            self.agent_deps.message_history = self.message_history
+        # Loop to handle chain routing, bounded by MAX_HANDOFF_DEPTH
+        for _depth in range(self.MAX_HANDOFF_DEPTH):
+            workflow.logger.info("Running the current agent of %s with %s", current_agent, current_input)
 
-            workflow.logger.info(f"Running the current agent of {current_agent} with {current_input}")
-
-            # Run the current agent
+            # Run the current agent with a bounded slice of the history so
+            # prompt size stays flat on long conversations
             result = await current_agent.run(
                 current_input,
                 deps=self.agent_deps,
-                message_history=self.message_history
+                message_history=self._history_window()
             )
 
             # Add agent's new messages to history
@@ -128,8 +168,17 @@ class WealthManagementWorkflow(PydanticAIWorkflow):
 
             # Check if output function signaled a route
             if self.agent_deps.next_agent:
+                # A self-handoff is a cycle, not a route - treat as terminal
+                if self.agent_deps.next_agent == self.agent_deps.current_agent_name:
+                    workflow.logger.warning("Ignoring self-handoff to %s", self.agent_deps.next_agent)
+                    self.agent_deps.next_agent = None
+                    self.agent_deps.trigger_message = None
+                    if result.output and result.output.strip():
+                        response = result.output
+                    break
+
                 # Routing detected - switch to next agent
-                workflow.logger.info(f"\n>>> Routing: {self.agent_deps.current_agent_name} → {self.agent_deps.next_agent}")
+                workflow.logger.info("Routing: %s -> %s", self.agent_deps.current_agent_name, self.agent_deps.next_agent)
 
                 self.agent_deps.current_agent_name = self.agent_deps.next_agent
                 current_agent = self._get_current_agent()
@@ -146,16 +195,29 @@ class WealthManagementWorkflow(PydanticAIWorkflow):
                 if result.output and result.output.strip():
                     response = result.output
                 break
+        else:
+            workflow.logger.warning("Handoff chain exceeded %d hops; giving up", self.MAX_HANDOFF_DEPTH)
+            response = "I encountered a problem routing your request. Please try again."
 
         # update the chat interaction
-        workflow.logger.info("Getting ready to set response to {response}")
         chat_interaction.text_response = response
 
+    def _history_window(self) -> List[ModelMessage]:
+        """
+        Bounded view of the history for model calls. Cuts only at a
+        user-turn boundary so tool calls stay paired with their returns.
+        """
+        if len(self.message_history) <= self.HISTORY_MAX:
+            return self.message_history
+
+        for idx in range(len(self.message_history) - self.HISTORY_WINDOW, len(self.message_history)):
+            msg = self.message_history[idx]
+            if isinstance(msg, ModelRequest) and any(
+                    isinstance(part, UserPromptPart) for part in msg.parts):
+                return self.message_history[idx:]
+
+        return self.message_history
+
     def _get_current_agent(self) -> Agent:
         """Get the agent instance based on current_agent_name."""
-        if self.agent_deps.current_agent_name == BENE_AGENT_NAME:
-            return temporal_bene_agent
-        elif self.agent_deps.current_agent_name == INVEST_AGENT_NAME:
-            return temporal_invest_agent
-        else:
-            return temporal_super_agent        
\ No newline at end of file
+        return AGENT_MAP.get(self.agent_deps.current_agent_name, temporal_super_agent)
\ No newline at end of file